@@ -1,178 +1,282 @@
-# !/usr/bin/env python3
-from collections import namedtuple
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-import pandas as pd
-from urllib import parse
-import argparse
-
-# A namedtuple consists of ("Type", ["SubTypes", "Entity Name", "Url", "Short Description"])
-Element = namedtuple("Element", ["subtype", "name", "url", "desc"])  # contains all needed info about each table entry
-
-# List of Categories from Airtable
-# Sub-categories are categories that are listed in Airtable
-CATEGORIES = {
-    "Communities": {"Committees", "Communities","Working Groups"},
-    "Data Glossaries": {"Data Glossaries", "Other", "Top-20 Data terms"},
-    "Learning Resources": {"Data Glossaries", "Documents", "Learning Resources", },
-    "Organizations and Teams": {"Organizations", "Teams"},
-    "Projects/Initiatives": {"Projects/Initiatives"},
-    "Policy Instruments": {"Policy Instruments"},  
-}
-
-
-# Convert entries in the data frame into the "Element" type and return them as a list of "Elements"
-def df_to_elem(group) -> list:
-
-    # Nested Function / Helper function - creates an element as long as the url is not na
-    def make_elem(r):
-        url = r["URL"] if not pd.isna(r["URL"]) else None  # Add a url if the url field is not empty
-        description = r["Description"] if not pd.isna(r["Description"]) else None
-        element = Element(r["Sub-Type"], r["Entity Name"], url, description)
-        return element  # Return an element with the name from dictionary and url
-
-    list_elems = [make_elem(r) for _, r in group.iterrows()]
-    
-    return list_elems   # Return a list of elements from the dataframe
-
-
-# Takes in given csv file and converts it to a dictionary containing necessary elements
-def load_data(path) -> dict:
-    # Initialize dataframe
-    df = (
-        pd.read_csv(path, usecols=["Label", "Type", "SubType", "URL", "Not4DERD", "Description"])  # read in columns from file
-        .dropna(subset=["Label", "SubType", "Type"])  # Discard Columns with NA values at Entity full name or Type
-        .reset_index(drop=True)  # Discard Airtable indexing
-    )
-
-    df = df[df.Not4DERD != "checked"]  # Discard entries that are Not4DERD
-    df.drop("Not4DERD", axis=1, inplace=True)  # Remove column "Entity Full Name"
-    # Clean names and remove unwanted chars
-    df["Type"] = df["Type"].str.strip()
-    df["Entity Name"] = df["Label"].str.strip()
-    df["Sub-Type"] = df["SubType"].str.strip()
-    df["Description"] = df["Description"].str.strip()
-    df["Description"] = df["Description"].str.replace('\n', '')
-    df["URL"] = df["URL"].str.strip()
-
-    # Remove column "Entity Full Name" and column "Entity sub-type"
-    df.drop("Label", axis=1, inplace=True)
-    df.drop("SubType", axis=1, inplace=True)
-
-    df.sort_values(by=['Type', 'Sub-Type', 'Entity Name'], inplace=True)  # Sort alphabetically by type, then sub-type, then name
-    df.reset_index(drop=True, inplace=True)  # Reset dataframe indices
-    
-    # Use split & explode
-    # df_long = (df.set_index(['Type', 'Description', 'URL', 'Entity Name'])
-    #            .apply(lambda x: x.str.split(',').explode())
-    #            .reset_index())
-    
-    new_rows = {"Type": [],  "URL": [], "Entity Name": [], "Sub-Type": [], "Description": []}  # Create dict entry with type, subtype, description, url, and entity name
-
-    # Fix the issue that some items have more than none sub-type and should be listed twice
-    for i, row in df.iterrows():  # Go through each row in the dataframe
-        current = row["Sub-Type"]
-
-        if isinstance(current, str):
-            types = [t.strip() for t in current.split(",")]  # Get a copy of every type in current row
-
-            for extra_type in types[1:]:  # Go through each type and add a new entry for each type
-                new_rows["Type"].append(row["Type"])  # Add a new row with the Type, Sub-Type, Url, and Entity
-                new_rows["URL"].append(row["URL"])
-                new_rows["Entity Name"].append(row["Entity Name"])
-                new_rows["Description"].append(row["Description"])
-                new_rows["Sub-Type"].append(extra_type)
-
-            df.iloc[i]["Sub-Type"] = types[0]  # Add to dataframe the index of the current entry
-
-    # Combine old dataframe with newly generated one and reset indices
-    df_long = pd.concat((df, pd.DataFrame.from_dict(new_rows))).reset_index(drop=True)
-
-    df_long.sort_values(by=['Type', 'Sub-Type', 'Entity Name'], inplace=True)  # Sort alphabetically by type, then sub-type, then name
-    df_long.reset_index(drop=True, inplace=True)  # Reset dataframe indices
-    
-    # Group each element in dataframe by Type and Sub-Type
-    grouped_df = df_long.groupby(["Type"])
-
-    # break down each entity into an element and create a dictionary of elements to use
-    element_dictionary = {tpl[0]: df_to_elem(tpl[1]) for tpl in grouped_df}
-
-    
-    # Return a dictionary containing Elements from the original data frame
-    return element_dictionary
-
-
-# Given full dictionary data, recategorize and select on the CATEGORIES we need
-def recategorize(data: dict) -> dict:
-
-    out = {k: [] for k in CATEGORIES.keys()}  # Resulting placeholder dictionary
-    for k, subcats in CATEGORIES.items():  # k = categories, subcats = sub elements of each category
-        for subc in subcats:  # Go through each sub category
-            if elems := data.get(subc):  # Extract from dictionary only categories and subcategories we want
-                out[k] += elems  # Also renames category to what is specified in CATEGORIES
-
-    return out  # Returns dictionary with shortened list of elements
-
-
-# Replaces characters so items are usable by Jinja
-def format_link_text(item) -> str:
-    return item.replace("/", f"/{chr(0x200b)}")
-
-
-# Puts urls into correct format for Jinja
-def gen_url(item) -> str:
-    if "/" in item:
-        return f"#{item.replace('/', '.2F')}"
-    return f"#{parse.quote(item.replace(' ', '_'), safe='')}"
-
-
-#  Creates and initializes parser
-def make_parser() -> argparse.ArgumentParser:
-
-    # Create and describe the parser
-    parser = argparse.ArgumentParser(
-        description="Generate Wikitext source for the Data Resource Directory GCpedia page."
-    )
-
-    # Add argument to parser, FileType reader that encodes given csv file to 'utf-8'
-    parser.add_argument(
-        "input",
-        nargs='?',
-        type=argparse.FileType("r", encoding='utf-8'),
-        help="Input file containing entity data.",
-    )
-
-    # Add argument to parser, FileType writer that will print the code to stdout by default
-    # ** Might be more useful to default output to an HTML or txt file to be copies into GCPedia
-    parser.add_argument(
-        "-o",
-        dest="output",
-        type=argparse.FileType('w', encoding='UTF-8'),
-        default="output_template.txt",
-        help="Destination file to write to. Defaults to stdout.",
-    )
-
-    return parser
-
-
-def main():
-
-    # Read and categorize data
-    args = make_parser().parse_args()  # Create parser to make I/O easier
-    data = recategorize(load_data(args.input))  # Load data from csv Airtable file and extract necessary data
-
-    # Incorporate Jinja2
-    env = Environment(loader=FileSystemLoader("."), autoescape=select_autoescape())  # Create Jinja2 environment
-
-    # Import data and clean it up for Jinja
-    env.globals.update(format_link_text=format_link_text, gen_url=gen_url, data=data)
-
-    template = env.get_template("drd_two_col.j2")  # Load the Jinja2 template with loader and return it
-
-    # Print template to text file which can then be copied into GCPedia
-    args.output.write(template.render())
-
-    print("\nCompleted Successfully \n")
-
-
-if __name__ == "__main__":
-    main()
+# !/usr/bin/env python3
+from collections.abc import Callable
+from dataclasses import dataclass
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+import pandas as pd
+from urllib import parse
+from itertools import chain
+import argparse
+import functools
+
+
+# Contains all needed info about each table entry; slots keep the per-entry memory footprint small
+@dataclass(slots=True, frozen=True)
+class Element:
+    subtype: str
+    name: str
+    url: str | None
+    desc: str | None
+
+
+# List of Categories from Airtable
+# Sub-categories are categories that are listed in Airtable
+CATEGORIES_EN = {
+    "Communities": {"Committees", "Communities","Working Groups"},
+    "Data Glossaries": {"Data Glossaries", "Other", "Top-20 Data terms"},
+    "Learning Resources": {"Data Glossaries", "Documents", "Learning Resources", },
+    "Organizations and Teams": {"Organizations", "Teams"},
+    "Projects/Initiatives": {"Projects/Initiatives"},
+    "Policy Instruments": {"Policy Instruments"},
+}
+
+CATEGORIES_FR = {
+    "Communautés ": {"Comités", "Communautés ", "Groupes de travail"},
+    "Glossaires de données": {"Glossaires de données", "Autre", "Les 20 principaux termes relatifs aux données"},
+    "Ressources d'apprentissage": {"Glossaires de données", "Documents", "Ressources d'apprentissage", },
+    "Organisations avec Équipes": {"Organisations", "Équipes"},
+    "Projets / initiatives": {"Projets / initiatives"},
+    "Instruments de politique": {"Instruments de politique"},
+}
+
+
+# Reads the two translation csv files once and hands back the same dictionaries on later calls
+@functools.lru_cache(maxsize=1)
+def load_translation_dicts():
+    # get the files containing translations, letting the parser read them straight from page cache
+    type_names = pd.read_csv("Entity Types-Grid view.csv", usecols=["Entity Type Eng", "Entity Type FR"],
+                             memory_map=True)
+    subtype_names = pd.read_csv("Entity sub-type-Grid view.csv", usecols=["Entity sub-type", "Entity sub-type FR"],
+                                memory_map=True)
+
+    # Zip the two columns straight into a dictionary for types and subtypes
+    type_dictionary = dict(zip(type_names["Entity Type Eng"], type_names["Entity Type FR"]))
+    subtype_dictionary = dict(zip(subtype_names["Entity sub-type"], subtype_names["Entity sub-type FR"]))
+
+    return type_dictionary, subtype_dictionary
+
+
+# Translates entity types and subtypes automatically using extra csv file
+def translate_types(data_frame):
+    type_dictionary, subtype_dictionary = load_translation_dicts()
+
+    # Translate every type in one vectorized dictionary lookup
+    data_frame.insert(0, "Type FR", data_frame["Type"].map(type_dictionary))
+
+    # Explode entries with more than one subtype into one row each, then translate each row;
+    # the caller gets the long-form frame back and needs no split/explode pass of its own.
+    # Rows whose subtype has no translation come back empty and get dropped later
+    data_frame["SubType FR"] = data_frame["SubType"].str.split(",")
+    data_frame = data_frame.explode("SubType FR", ignore_index=True)
+    data_frame["SubType FR"] = data_frame["SubType FR"].str.strip().map(subtype_dictionary)
+
+    return data_frame
+
+
+# Per-language configuration: the locale specific csv columns, categories, template,
+# default output file, and the optional translation step applied after the csv is read
+@dataclass(slots=True, frozen=True)
+class Locale:
+    entity_col: str
+    url_col: str
+    desc_col: str
+    template: str
+    categories: dict
+    default_output: str
+    translate: Callable | None = None
+
+
+LOCALES = {
+    "en": Locale(
+        entity_col="Label",
+        url_col="URL",
+        desc_col="Description",
+        template="drd_two_col.j2",
+        categories=CATEGORIES_EN,
+        default_output="output_template.txt",
+    ),
+    "fr": Locale(
+        entity_col="French Entity Full Name",
+        url_col="French URL",
+        desc_col="French Description",
+        template="drd_two_col_FR.j2",
+        categories=CATEGORIES_FR,
+        default_output="output_template_FR.txt",
+        translate=translate_types,
+    ),
+}
+
+
+# Convert entries in the data frame into the "Element" type and return them as a list of "Elements"
+def df_to_elem(group) -> list:
+
+    # Walk the columns as plain arrays instead of building a Series object per row;
+    # missing urls and descriptions come out as None so the template can skip them
+    subtypes = group["Sub-Type"].to_numpy()
+    names = group["Entity Name"].to_numpy()
+    urls = group["URL"].to_numpy(na_value=None)
+    descriptions = group["Description"].to_numpy(na_value=None)
+
+    list_elems = [Element(s, n, u, d) for s, n, u, d in zip(subtypes, names, urls, descriptions)]
+
+    return list_elems   # Return a list of elements from the dataframe
+
+
+# Takes in given csv file and converts it to a dictionary containing necessary elements
+def load_data(path, locale: Locale) -> dict:
+    # Initialize dataframe
+    df = (
+        pd.read_csv(path, usecols=[locale.entity_col, "Type", "SubType", locale.url_col, "Not4DERD", locale.desc_col],
+                    engine="pyarrow", dtype_backend="pyarrow")  # read in columns as Arrow-backed strings
+        .dropna(subset=[locale.entity_col, "SubType", "Type"])  # Discard Columns with NA values at Entity full name or Type
+        .reset_index(drop=True)  # Discard Airtable indexing
+    )
+
+    # Discard entries that are Not4DERD before any translation or cleaning work is spent on them;
+    # empty cells mean keep
+    df = df[df.Not4DERD.fillna("") != "checked"]
+    df.drop("Not4DERD", axis=1, inplace=True)
+
+    # Call the translator when the locale needs one; it returns one row per entity and sub-type pair
+    if locale.translate is not None:
+        df = locale.translate(df)
+        df.drop(["SubType", "Type"], axis=1, inplace=True)
+
+        # Remove any entries that do not have a translation
+        df = df.dropna(subset=["SubType FR", "Type FR"])
+        df.rename(columns={"Type FR": "Type", "SubType FR": "SubType"}, inplace=True)
+
+    # Rename the locale specific columns to what the template expects
+    df.rename(columns={locale.entity_col: "Entity Name", "SubType": "Sub-Type",
+                       locale.url_col: "URL", locale.desc_col: "Description"}, inplace=True)
+
+    # Clean names and remove unwanted chars in a single trim pass over every text column
+    text_cols = ["Type", "Entity Name", "Sub-Type", "Description", "URL"]
+    df[text_cols] = df[text_cols].apply(lambda s: s.str.strip())
+    df["Description"] = df["Description"].str.replace('\n', '')  # Newlines inside descriptions break the Wikitext
+
+    # Fix the issue that some items have more than one sub-type and should be listed twice
+    # (a translating locale already exploded the frame, so only split here for the others)
+    if locale.translate is None:
+        df["Sub-Type"] = df["Sub-Type"].str.split(",")  # Split comma separated sub-types into lists
+        df = df.explode("Sub-Type", ignore_index=True)  # Create one row per entity and sub-type pair
+        df["Sub-Type"] = df["Sub-Type"].str.strip()  # Remove whitespace left around the separators
+    df_long = df
+
+    # Every comma separated value must be fully exploded or a combined group like "a,b" would pollute the output
+    assert not df_long["Sub-Type"].str.contains(",").any(), "Sub-Type still holds unexploded comma separated values"
+
+    df_long.sort_values(by=['Type', 'Sub-Type', 'Entity Name'], inplace=True)  # Sort alphabetically by type, then sub-type, then name
+    df_long.reset_index(drop=True, inplace=True)  # Reset dataframe indices
+
+    # Keep only the types recategorize will actually use, so unused groups are never built
+    wanted = sorted(set().union(*locale.categories.values()))
+    df_long = df_long[df_long["Type"].isin(wanted)]
+    df_long["Type"] = pd.Categorical(df_long["Type"], categories=wanted)  # Integer codes instead of string hashing
+
+    # Group each element in dataframe by Type
+    grouped_df = df_long.groupby("Type", observed=True, sort=False)
+
+    # break down each entity into an element and create a dictionary of elements to use
+    element_dictionary = {tpl[0]: df_to_elem(tpl[1]) for tpl in grouped_df}
+
+
+    # Return a dictionary containing Elements from the original data frame
+    return element_dictionary
+
+
+# Given full dictionary data, recategorize and select on the CATEGORIES we need
+def recategorize(data: dict, categories: dict) -> dict:
+
+    # Chain each category's sub-category lists into a single list in one pass;
+    # this also renames the category to what is specified in the categories mapping
+    return {k: list(chain.from_iterable(data.get(subc, ()) for subc in subcats))
+            for k, subcats in categories.items()}
+
+
+# Replaces characters so items are usable by Jinja
+def format_link_text(item) -> str:
+    return item.replace("/", f"/{chr(0x200b)}")
+
+
+# Puts urls into correct format for Jinja
+def gen_url(item) -> str:
+    if "/" in item:
+        return f"#{item.replace('/', '.2F')}"
+    return f"#{parse.quote(item.replace(' ', '_'), safe='')}"
+
+
+# Builds the Jinja2 environment once and reuses the compiled template on repeated runs
+@functools.lru_cache(maxsize=None)
+def get_template(name):
+    env = Environment(
+        loader=FileSystemLoader("."),
+        autoescape=select_autoescape(),
+        bytecode_cache=FileSystemBytecodeCache(),  # Keep compiled template bytecode across processes
+        auto_reload=False,  # Skip the stat() on the template source before every render
+        cache_size=400,
+    )
+    return env.get_template(name)
+
+
+#  Creates and initializes parser
+def make_parser(default_lang="en") -> argparse.ArgumentParser:
+
+    # Create and describe the parser
+    parser = argparse.ArgumentParser(
+        description="Generate Wikitext source for the Data Resource Directory GCpedia page."
+    )
+
+    # Add argument to parser; the path is handed to read_csv directly so the pyarrow
+    # engine can memory-map the file instead of streaming through a Python file object
+    parser.add_argument(
+        "input",
+        nargs='?',
+        help="Input file containing entity data.",
+    )
+
+    # Add argument to parser; the destination is kept as a path so main can open it
+    # in binary mode with a large write buffer
+    parser.add_argument(
+        "-o",
+        dest="output",
+        default=None,
+        help="Destination file to write to. Defaults to a txt file named after the language.",
+    )
+
+    # Add argument selecting which language version of the page to generate
+    parser.add_argument(
+        "--lang",
+        choices=sorted(LOCALES),
+        default=default_lang,
+        help="Language of the generated page.",
+    )
+
+    return parser
+
+
+def main(default_lang="en"):
+
+    # Read and categorize data
+    args = make_parser(default_lang).parse_args()  # Create parser to make I/O easier
+    locale = LOCALES[args.lang]
+    data = recategorize(load_data(args.input, locale), locale.categories)  # Load data from csv Airtable file and extract necessary data
+
+    # Incorporate Jinja2 - the compiled template is cached so repeated runs skip re-parsing
+    template = get_template(locale.template)
+
+    # Precompute the header menu anchors and link text once, instead of having the
+    # template call the helpers during the render
+    nav = [(gen_url(cat), format_link_text(cat)) for cat in data]
+
+    # Stream template output to a text file which can then be copied into GCPedia,
+    # writing utf-8 blocks through one large binary buffer instead of materializing
+    # the whole page in memory first
+    output_path = args.output if args.output is not None else locale.default_output
+    with open(output_path, 'wb', buffering=1 << 20) as output:
+        template.stream(nav=nav, data=data).dump(output, encoding='utf-8')
+
+    print("\nCompleted Successfully \n")
+
+
+if __name__ == "__main__":
+    main()